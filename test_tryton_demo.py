@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import tracemalloc
+import unittest
+
+try:
+    import tryton_demo
+except ImportError:
+    tryton_demo = None
+
+
+class _Config(object):
+    context = {}
+
+
+class _Party(object):
+    'Stub of a Model with count records which are never materialized'
+
+    def __init__(self, count):
+        self.count = count
+        self.written = 0
+
+    def search(self, domain, offset, limit, order, context):
+        return list(range(offset + 1, min(offset + limit, self.count) + 1))
+
+    def write(self, ids, values, context):
+        self.written += len(ids)
+
+
+@unittest.skipIf(tryton_demo is None, 'proteus is not installed')
+class WriteAllTestCase(unittest.TestCase):
+
+    def peak(self, count):
+        'Return the peak memory used by write_all on count records'
+        model = _Party(count)
+        tracemalloc.start()
+        try:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            tryton_demo.write_all(_Config, model, [], {'name': 'Test'})
+            peak = tracemalloc.get_traced_memory()[1] - base
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(model.written, count)
+        return peak
+
+    def test_memory_flat(self):
+        'The memory of write_all does not grow with the number of records'
+        count = 20 * tryton_demo.BATCH_SIZE
+        self.assertLess(self.peak(10 * count), 2 * self.peak(count))
+
+
+if __name__ == '__main__':
+    unittest.main()